@@ -0,0 +1,42 @@
+// -------------------------------------------------------------------------------------------------
+//  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+//  https://nautechsystems.io
+//
+//  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+//  You may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+//
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+// -------------------------------------------------------------------------------------------------
+
+use std::hint::black_box;
+
+use criterion::{criterion_group, criterion_main, Criterion};
+use nautilus_cryptography::signing::hmac_signature;
+
+fn bench_hmac_signature_query(c: &mut Criterion) {
+    let secret = "2b4ac8c4a6f5d0e1b3c9f7a8e6d4c2b0a1f3e5d7c9b8a6f4e2d0c1b3a5f7e9d8";
+    let data = "symbol=BTCUSDT&side=BUY&type=LIMIT&timeInForce=GTC&quantity=1&price=9000&recvWindow=5000&timestamp=1591702613943";
+    c.bench_function("hmac_signature (query)", |b| {
+        b.iter(|| hmac_signature(black_box(secret), black_box(data)));
+    });
+}
+
+fn bench_hmac_signature_body(c: &mut Criterion) {
+    let secret = "2b4ac8c4a6f5d0e1b3c9f7a8e6d4c2b0a1f3e5d7c9b8a6f4e2d0c1b3a5f7e9d8";
+    let data = r#"1658384314791XXXXXXXXXX5000{"category":"linear","symbol":"BTCUSDT","side":"Buy","orderType":"Limit","qty":"0.001","price":"25000","timeInForce":"GTC","orderLinkId":"O-20240101-000000-001-001-1"}"#;
+    c.bench_function("hmac_signature (body)", |b| {
+        b.iter(|| hmac_signature(black_box(secret), black_box(data)));
+    });
+}
+
+criterion_group!(
+    benches,
+    bench_hmac_signature_query,
+    bench_hmac_signature_body,
+);
+criterion_main!(benches);
@@ -23,12 +23,16 @@ pub fn py_hmac_signature(secret: &str, data: &str) -> PyResult<String> {
     Ok(hmac_signature(secret, data))
 }
 
+// Releases the GIL while signing so callers can offload it to a worker thread
 #[pyfunction(name = "rsa_signature")]
-pub fn py_rsa_signature(private_key_pem: &str, data: &str) -> PyResult<String> {
-    rsa_signature(private_key_pem, data).map_err(to_pyvalue_err)
+pub fn py_rsa_signature(py: Python<'_>, private_key_pem: &str, data: &str) -> PyResult<String> {
+    py.allow_threads(|| rsa_signature(private_key_pem, data))
+        .map_err(to_pyvalue_err)
 }
 
+// Releases the GIL while signing so callers can offload it to a worker thread
 #[pyfunction(name = "ed25519_signature")]
-pub fn py_ed25519_signature(private_key: &[u8], data: &str) -> PyResult<String> {
-    ed25519_signature(private_key, data).map_err(to_pyvalue_err)
+pub fn py_ed25519_signature(py: Python<'_>, private_key: &[u8], data: &str) -> PyResult<String> {
+    py.allow_threads(|| ed25519_signature(private_key, data))
+        .map_err(to_pyvalue_err)
 }
@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import asyncio
 import urllib.parse
 from typing import Any
 
@@ -161,7 +162,11 @@ class BinanceHttpClient:
         if payload is None:
             payload = {}
         query_string = self._prepare_params(payload)
-        signature = self._get_sign(query_string)
+        if self._key_type == BinanceKeyType.RSA:
+            # RSA signing is comparatively slow, so run it off the event loop
+            signature = await asyncio.to_thread(self._get_sign, query_string)
+        else:
+            signature = self._get_sign(query_string)
         payload["signature"] = signature
         return await self.send_request(
             http_method,
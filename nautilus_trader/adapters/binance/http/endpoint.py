@@ -51,9 +51,6 @@ class BinanceHttpEndpoint:
         self.methods_desc = methods_desc
         self.url_path = url_path
 
-        self.decoder = msgspec.json.Decoder()
-        self.encoder = msgspec.json.Encoder(enc_hook=enc_hook)
-
         self._method_request = {
             BinanceSecurityType.NONE: self.client.send_request,
             BinanceSecurityType.USER_STREAM: self.client.send_request,
@@ -69,7 +66,7 @@ class BinanceHttpEndpoint:
         params: Any,
         ratelimiter_keys: list[str] | None = None,
     ) -> bytes:
-        payload: dict = self.decoder.decode(self.encoder.encode(params))
+        payload: dict = msgspec.to_builtins(params, enc_hook=enc_hook)
         if self.methods_desc[method_type] is None:
             raise RuntimeError(
                 f"{method_type.name} not available for {self.url_path}",
@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import asyncio
 import sys
 import time
 
@@ -43,6 +44,31 @@ from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.identifiers import InstrumentId
 
 
+# Fixed kline interval durations (ms), month klines vary in length so are excluded
+_KLINE_INTERVAL_MS: dict[BinanceKlineInterval, int] = {
+    BinanceKlineInterval.SECOND_1: 1_000,
+    BinanceKlineInterval.MINUTE_1: 60_000,
+    BinanceKlineInterval.MINUTE_3: 180_000,
+    BinanceKlineInterval.MINUTE_5: 300_000,
+    BinanceKlineInterval.MINUTE_15: 900_000,
+    BinanceKlineInterval.MINUTE_30: 1_800_000,
+    BinanceKlineInterval.HOUR_1: 3_600_000,
+    BinanceKlineInterval.HOUR_2: 7_200_000,
+    BinanceKlineInterval.HOUR_4: 14_400_000,
+    BinanceKlineInterval.HOUR_6: 21_600_000,
+    BinanceKlineInterval.HOUR_8: 28_800_000,
+    BinanceKlineInterval.HOUR_12: 43_200_000,
+    BinanceKlineInterval.DAY_1: 86_400_000,
+    BinanceKlineInterval.DAY_3: 259_200_000,
+    BinanceKlineInterval.WEEK_1: 604_800_000,
+}
+
+_KLINES_DEFAULT_LIMIT = 500  # Applied by Binance when no limit is specified
+_KLINES_MAX_LIMIT_SPOT = 1000  # Max klines returned per request (Spot/Margin)
+_KLINES_MAX_LIMIT_FUTURES = 1500  # Max klines returned per request (Futures)
+_KLINES_BATCH_SIZE = 8  # Max concurrent kline requests per batch
+
+
 class BinancePingHttp(BinanceHttpEndpoint):
     """
     Endpoint for testing connectivity to the REST API.
@@ -629,10 +655,13 @@ class BinanceMarketHttpAPI:
 
         if account_type.is_spot_or_margin:
             self.base_endpoint = "/api/v3/"
+            self._klines_max_limit = _KLINES_MAX_LIMIT_SPOT
         elif account_type == BinanceAccountType.USDT_FUTURE:
             self.base_endpoint = "/fapi/v1/"
+            self._klines_max_limit = _KLINES_MAX_LIMIT_FUTURES
         elif account_type == BinanceAccountType.COIN_FUTURE:
             self.base_endpoint = "/dapi/v1/"
+            self._klines_max_limit = _KLINES_MAX_LIMIT_FUTURES
         else:
             raise RuntimeError(  # pragma: no cover (design-time error)
                 f"invalid `BinanceAccountType`, was {account_type}",  # pragma: no cover
@@ -903,7 +932,24 @@ class BinanceMarketHttpAPI:
     ) -> list[BinanceBar]:
         """
         Request Binance Bars from Klines.
+
+        If start_time and end_time are both specified for a fixed length interval, the
+        range after the first page is split into pages which are requested concurrently
+        in batches.
+
         """
+        interval_ms = _KLINE_INTERVAL_MS.get(interval)
+        if start_time is not None and end_time is not None and interval_ms is not None:
+            return await self._request_binance_bars_batched(
+                bar_type=bar_type,
+                ts_init=ts_init,
+                interval=interval,
+                interval_ms=interval_ms,
+                limit=limit,
+                start_time=start_time,
+                end_time=end_time,
+            )
+
         end_time_ms = int(end_time) if end_time is not None else sys.maxsize
         all_bars: list[BinanceBar] = []
         while True:
@@ -934,6 +980,67 @@ class BinanceMarketHttpAPI:
 
         return all_bars
 
+    async def _request_binance_bars_batched(
+        self,
+        bar_type: BarType,
+        ts_init: int,
+        interval: BinanceKlineInterval,
+        interval_ms: int,
+        limit: int | None,
+        start_time: int,
+        end_time: int,
+    ) -> list[BinanceBar]:
+        symbol = bar_type.instrument_id.symbol.value
+        page_limit = min(limit or _KLINES_DEFAULT_LIMIT, self._klines_max_limit)
+        end_time = min(end_time, nanos_to_millis(time.time_ns()))
+
+        # Anchor on the first page so any range before the first kline is skipped
+        klines = await self.query_klines(
+            symbol=symbol,
+            interval=interval,
+            limit=page_limit,
+            start_time=start_time,
+            end_time=end_time,
+        )
+        all_bars: list[BinanceBar] = [
+            kline.parse_to_binance_bar(bar_type, ts_init) for kline in klines
+        ]
+        if len(klines) < page_limit:
+            return all_bars
+
+        # Each window spans at most one page of klines, so no window can be truncated
+        page_ms = page_limit * interval_ms
+        windows = [
+            (window_start, min(window_start + page_ms - 1, end_time))
+            for window_start in range(klines[-1].open_time + 1, end_time + 1, page_ms)
+        ]
+
+        # A failed window cancels the rest of its batch, and its error is raised as is
+        # (not wrapped in an ExceptionGroup) to match the sequential path
+        for i in range(0, len(windows), _KLINES_BATCH_SIZE):
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [
+                        tg.create_task(
+                            self.query_klines(
+                                symbol=symbol,
+                                interval=interval,
+                                limit=page_limit,
+                                start_time=window_start,
+                                end_time=window_end,
+                            ),
+                        )
+                        for window_start, window_end in windows[i : i + _KLINES_BATCH_SIZE]
+                    ]
+            except ExceptionGroup as e:
+                raise e.exceptions[0] from None
+            for task in tasks:
+                all_bars.extend(
+                    kline.parse_to_binance_bar(bar_type, ts_init) for kline in task.result()
+                )
+
+        return all_bars
+
     async def query_ticker_24hr(
         self,
         symbol: str | None = None,
@@ -45,9 +45,6 @@ class BybitHttpEndpoint:
         self.endpoint_type = endpoint_type
         self.url_path = url_path
 
-        self.decoder = msgspec.json.Decoder()
-        self.encoder = msgspec.json.Encoder(enc_hook=enc_hook)
-
         self._method_request: dict[BybitEndpointType, Any] = {
             BybitEndpointType.NONE: self.client.send_request,
             BybitEndpointType.MARKET: self.client.send_request,
@@ -64,7 +61,7 @@ class BybitHttpEndpoint:
         params: Any | None = None,
         ratelimiter_keys: Any | None = None,
     ) -> bytes:
-        payload: dict = self.decoder.decode(self.encoder.encode(params))
+        payload: dict = msgspec.to_builtins(params, enc_hook=enc_hook)
         method_call = self._method_request[self.endpoint_type]
         raw: bytes = await method_call(
             http_method=method_type,
@@ -29,12 +29,9 @@ from nautilus_trader.core.nautilus_pyo3 import Quota
 from nautilus_trader.core.nautilus_pyo3 import hmac_signature
 
 
-class BybitResponse(msgspec.Struct, frozen=True):
+class BybitResponseCode(msgspec.Struct, frozen=True):
     retCode: int
     retMsg: str
-    result: dict[str, Any]
-    time: int | None = None
-    retExtInfo: dict[str, Any] | None = None
 
 
 class BybitHttpClient:
@@ -75,6 +72,7 @@ class BybitHttpClient:
         self._api_key: str = api_key
         self._api_secret: str = api_secret
         self._recv_window_ms: int = recv_window_ms
+        self._recv_window_ms_str: str = str(recv_window_ms)
 
         self._base_url: str = base_url
         self._headers: dict[str, Any] = {
@@ -86,7 +84,7 @@ class BybitHttpClient:
             keyed_quotas=ratelimiter_quotas or [],
             default_quota=ratelimiter_default_quota,
         )
-        self._decoder_response = msgspec.json.Decoder(BybitResponse)
+        self._decoder_response_code = msgspec.json.Decoder(BybitResponseCode)
 
     @property
     def api_key(self) -> str:
@@ -104,17 +102,20 @@ class BybitHttpClient:
         signature: str | None = None,
         timestamp: str | None = None,
         ratelimiter_keys: list[str] | None = None,
+        body: bytes | None = None,
     ) -> bytes:
         if payload and http_method == HttpMethod.GET:
             url_path += "?" + parse.urlencode(payload)
             payload = None
+        if body is None and payload:
+            body = msgspec.json.encode(payload)
         url = self._base_url + url_path
         if signature is not None:
             headers = {
                 **self._headers,
                 "X-BAPI-TIMESTAMP": timestamp,
                 "X-BAPI-SIGN": signature,
-                "X-BAPI-RECV-WINDOW": str(self._recv_window_ms),
+                "X-BAPI-RECV-WINDOW": self._recv_window_ms_str,
             }
         else:
             headers = self._headers
@@ -123,7 +124,7 @@ class BybitHttpClient:
             http_method,
             url,
             headers,
-            msgspec.json.encode(payload) if payload else None,
+            body,
             ratelimiter_keys,
         )
 
@@ -140,11 +141,12 @@ class BybitHttpClient:
                 message=message,
             )
 
-        bybit_resp: BybitResponse = self._decoder_response.decode(response_body)
-        if bybit_resp.retCode == 0:
+        # Only the status fields are decoded here, the endpoint decoders parse the result
+        bybit_resp_code = self._decoder_response_code.decode(response_body)
+        if bybit_resp_code.retCode == 0:
             return response_body
         else:
-            raise BybitError(code=bybit_resp.retCode, message=bybit_resp.retMsg)
+            raise BybitError(code=bybit_resp_code.retCode, message=bybit_resp_code.retMsg)
 
     async def sign_request(
         self,
@@ -156,30 +158,36 @@ class BybitHttpClient:
         if payload is None:
             payload = {}
 
-        [timestamp, authed_signature] = (
-            self._sign_get_request(payload)
-            if http_method == HttpMethod.GET
-            else self._sign_post_request(payload)
-        )
+        # Encode the query or body once, it is both signed and sent as is
+        body: bytes | None = None
+        if http_method == HttpMethod.GET:
+            query = parse.urlencode(payload)
+            [timestamp, authed_signature] = self._sign_get_request(query)
+            if query:
+                url_path += "?" + query
+        else:
+            encoded = msgspec.json.encode(payload)
+            [timestamp, authed_signature] = self._sign_post_request(encoded)
+            if payload:
+                body = encoded
+
         return await self.send_request(
             http_method=http_method,
             url_path=url_path,
-            payload=payload,
             signature=authed_signature,
             timestamp=timestamp,
             ratelimiter_keys=ratelimiter_keys,
+            body=body,
         )
 
-    def _sign_post_request(self, payload: dict[str, Any]) -> list[str]:
+    def _sign_post_request(self, body: bytes) -> list[str]:
         timestamp = str(self._clock.timestamp_ms())
-        payload_str = msgspec.json.encode(payload).decode()
-        result = timestamp + self._api_key + str(self._recv_window_ms) + payload_str
+        result = timestamp + self._api_key + self._recv_window_ms_str + body.decode()
         signature = hmac_signature(self._api_secret, result)
         return [timestamp, signature]
 
-    def _sign_get_request(self, payload: dict[str, Any]) -> list[str]:
+    def _sign_get_request(self, query: str) -> list[str]:
         timestamp = str(self._clock.timestamp_ms())
-        payload_str = parse.urlencode(payload)
-        result = timestamp + self._api_key + str(self._recv_window_ms) + payload_str
+        result = timestamp + self._api_key + self._recv_window_ms_str + query
         signature = hmac_signature(self._api_secret, result)
         return [timestamp, signature]
@@ -15,11 +15,11 @@
 
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING
 from zipfile import ZipFile
 from zipfile import is_zipfile
 
+import msgspec
 import pandas as pd
 
 from nautilus_trader.adapters.bybit.common.enums import BybitProductType
@@ -30,6 +30,20 @@ if TYPE_CHECKING:
     from os import PathLike
 
 
+class _BybitOrderBookFileData(msgspec.Struct):
+    # Only the fields used by the loader, a side may be absent from a line
+    s: str
+    seq: int
+    a: list[list[str]] = []
+    b: list[list[str]] = []
+
+
+class _BybitOrderBookFileLine(msgspec.Struct):
+    type: str
+    ts: int
+    data: _BybitOrderBookFileData
+
+
 class BybitOrderBookDeltaDataLoader:
     """
     Provides a means of loading Bybit order book data.
@@ -61,7 +75,7 @@ class BybitOrderBookDeltaDataLoader:
         """
         assert is_zipfile(file_path), "depth_file must be zip file provided by ByBit"
 
-        orderbook_keys = ["a", "b"]
+        decoder = msgspec.json.Decoder(_BybitOrderBookFileLine)
         rows = []
 
         with ZipFile(file_path, "r") as zipfile:
@@ -69,51 +83,53 @@ class BybitOrderBookDeltaDataLoader:
                 for i, row in enumerate(f):
                     if nrows is not None and i >= nrows:
                         break
-                    obj = json.loads(row.strip())
-                    timestamp_ns = int(float(obj["ts"]) * 1_000_000)
-                    timestamp = pd.to_datetime(timestamp_ns, unit="ns", utc=True)
-
-                    data = obj["data"]
-                    instrument_id = f"{data['s']}-{product_type.value.upper()}.BYBIT"
-                    update_type = obj["type"]
-                    sequence = data["seq"]
-
-                    for key in orderbook_keys:
-                        if key in data:
-                            if update_type == "snapshot":
-                                rows.append(
-                                    {
-                                        "timestamp": timestamp,
-                                        "instrument_id": instrument_id,
-                                        "action": "CLEAR",
-                                        "side": cls.map_sides(key),
-                                        "order_id": 0,
-                                        "flags": 0,
-                                        "price": data[key][-1][0],
-                                        "size": 0,
-                                        "sequence": sequence,
-                                    },
-                                )
-
-                            rows.extend(
-                                [
-                                    {
-                                        "timestamp": timestamp,
-                                        "instrument_id": instrument_id,
-                                        "action": cls.map_actions(update_type, float(qty)),
-                                        "side": cls.map_sides(key),
-                                        "order_id": 0,
-                                        "flags": cls.map_flags(update_type),
-                                        "price": px,
-                                        "size": qty,
-                                        "sequence": sequence,
-                                    }
-                                    for px, qty in data[key]
-                                ],
+                    msg = decoder.decode(row)
+                    timestamp = msg.ts * 1_000_000
+
+                    data = msg.data
+                    instrument_id = f"{data.s}-{product_type.value.upper()}.BYBIT"
+                    update_type = msg.type
+                    sequence = data.seq
+
+                    for key, levels in (("a", data.a), ("b", data.b)):
+                        if not levels:
+                            continue
+                        if update_type == "snapshot":
+                            rows.append(
+                                {
+                                    "timestamp": timestamp,
+                                    "instrument_id": instrument_id,
+                                    "action": "CLEAR",
+                                    "side": cls.map_sides(key),
+                                    "order_id": 0,
+                                    "flags": 0,
+                                    "price": levels[-1][0],
+                                    "size": 0,
+                                    "sequence": sequence,
+                                },
                             )
 
+                        rows.extend(
+                            [
+                                {
+                                    "timestamp": timestamp,
+                                    "instrument_id": instrument_id,
+                                    "action": cls.map_actions(update_type, float(qty)),
+                                    "side": cls.map_sides(key),
+                                    "order_id": 0,
+                                    "flags": cls.map_flags(update_type),
+                                    "price": px,
+                                    "size": qty,
+                                    "sequence": sequence,
+                                }
+                                for px, qty in levels
+                            ],
+                        )
+
         df = pd.DataFrame(rows)
 
+        # Convert the whole column at once rather than a `pd.Timestamp` per row
+        df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ns", utc=True)
         df = df.set_index("timestamp")
 
         df = df.astype(
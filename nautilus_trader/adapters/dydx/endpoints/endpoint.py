@@ -50,9 +50,6 @@ class DYDXHttpEndpoint:
         self.url_path = url_path
         self.name = name
 
-        self.decoder = msgspec.json.Decoder()
-        self.encoder = msgspec.json.Encoder()
-
         self._method_request: dict[DYDXEndpointType, Any] = {
             DYDXEndpointType.NONE: self.client.send_request,
             DYDXEndpointType.ACCOUNT: self.client.send_request,
@@ -73,7 +70,7 @@ class DYDXHttpEndpoint:
         params: Any | None = None,
         url_path: str | None = None,
     ) -> bytes | None:
-        payload: dict = self.decoder.decode(self.encoder.encode(params))
+        payload: dict = msgspec.to_builtins(params)
         method_call = self._method_request[self.endpoint_type]
         url_path = url_path or self.url_path
         retry_name = self.name or "http_call"
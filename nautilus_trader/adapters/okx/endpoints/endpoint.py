@@ -39,9 +39,6 @@ class OKXHttpEndpoint:
         self.endpoint_type = endpoint_type
         self.url_path = url_path
 
-        self.decoder = msgspec.json.Decoder()
-        self.encoder = msgspec.json.Encoder(enc_hook=enc_hook)
-
         self._method_request: dict[OKXEndpointType, Any] = {
             OKXEndpointType.NONE: self.client.send_request,
             OKXEndpointType.MARKET: self.client.send_request,
@@ -57,7 +54,7 @@ class OKXHttpEndpoint:
         params: Any | None = None,
         ratelimiter_keys: Any | None = None,
     ) -> bytes:
-        payload: dict = self.decoder.decode(self.encoder.encode(params))
+        payload: dict = msgspec.to_builtins(params, enc_hook=enc_hook)
         method_call = self._method_request[self.endpoint_type]
         raw: bytes = await method_call(
             http_method=method_type,
@@ -58,6 +58,7 @@ from nautilus_trader.common.component import LiveClock
 from nautilus_trader.common.component import MessageBus
 from nautilus_trader.common.enums import LogColor
 from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.core.datetime import dt_to_unix_nanos
 from nautilus_trader.core.datetime import millis_to_nanos
 from nautilus_trader.core.datetime import unix_nanos_to_dt
 from nautilus_trader.core.uuid import UUID4
@@ -490,9 +491,11 @@ class OKXExecutionClient(LiveExecutionClient):
         # basis of OKX's chronological sorting of orders
         reports = sorted(dedup_report_dict.values(), key=lambda r: r.ts_accepted)
         if start:
-            reports = list(filter(lambda r: start <= unix_nanos_to_dt(r.ts_accepted), reports))
+            start_ns = dt_to_unix_nanos(start)
+            reports = [r for r in reports if start_ns <= r.ts_accepted]
         if end:
-            reports = list(filter(lambda r: unix_nanos_to_dt(r.ts_accepted) <= end, reports))
+            end_ns = dt_to_unix_nanos(end)
+            reports = [r for r in reports if r.ts_accepted <= end_ns]
 
         len_reports = len(reports)
         plural = "" if len_reports == 1 else "s"
@@ -693,9 +696,11 @@ class OKXExecutionClient(LiveExecutionClient):
 
         reports = sorted(reports, key=lambda report: report.ts_event)
         if start:
-            reports = list(filter(lambda r: start <= unix_nanos_to_dt(r.ts_event), reports))
+            start_ns = dt_to_unix_nanos(start)
+            reports = [r for r in reports if start_ns <= r.ts_event]
         if end:
-            reports = list(filter(lambda r: unix_nanos_to_dt(r.ts_event) <= end, reports))
+            end_ns = dt_to_unix_nanos(end)
+            reports = [r for r in reports if r.ts_event <= end_ns]
 
         len_reports = len(reports)
         plural = "" if len_reports == 1 else "s"
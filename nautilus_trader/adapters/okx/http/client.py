@@ -15,13 +15,14 @@
 
 import base64
 import datetime
-import json
 from typing import Any
 from urllib import parse
 
 import msgspec
 
 import nautilus_trader
+from nautilus_trader.adapters.okx.common.error import raise_okx_error
+from nautilus_trader.adapters.okx.http.errors import OKXHttpError
 from nautilus_trader.common.component import LiveClock
 from nautilus_trader.common.component import Logger
 from nautilus_trader.core.nautilus_pyo3 import HttpClient
@@ -29,8 +30,6 @@ from nautilus_trader.core.nautilus_pyo3 import HttpMethod
 from nautilus_trader.core.nautilus_pyo3 import HttpResponse
 from nautilus_trader.core.nautilus_pyo3 import Quota
 from nautilus_trader.core.nautilus_pyo3 import hmac_signature
-from nautilus_trader.okx.common.error import raise_okx_error
-from nautilus_trader.okx.http.errors import OKXHttpError
 
 
 class OKXResponseCode(msgspec.Struct):
@@ -96,6 +95,14 @@ class OKXHttpClient:
             "Content-Type": "application/json",
             "User-Agent": nautilus_trader.USER_AGENT,
         }
+        if is_demo:
+            self._headers["x-simulated-trading"] = "1"
+        self._signed_headers: dict[str, Any] = {
+            **self._headers,
+            "OK-ACCESS-KEY": api_key,
+            "OK-ACCESS-PASSPHRASE": passphrase,
+        }
+
         self._client = HttpClient(
             keyed_quotas=ratelimiter_quotas or [],
             default_quota=ratelimiter_default_quota,
@@ -130,8 +137,9 @@ class OKXHttpClient:
     def _sign(self, timestamp: str, method: str, url_path: str, body: str) -> str:
         if body == "{}" or body == "None":
             body = ""
-        message = str(timestamp) + method.upper() + url_path + body
-        digest = hmac_signature(self._api_secret, message).encode()
+        message = timestamp + method + url_path + body
+        # OKX expects the base64 of the raw digest, not of its hex representation
+        digest = bytes.fromhex(hmac_signature(self._api_secret, message))
         return base64.b64encode(digest).decode()
 
     async def send_request(
@@ -147,23 +155,23 @@ class OKXHttpClient:
             url_path += "?" + parse.urlencode(payload)
             payload = None
         url = self._base_url + url_path
-        body = json.dumps(payload) if http_method == HttpMethod.POST else ""
+        body = msgspec.json.encode(payload) if http_method == HttpMethod.POST else b""
         if sign:
             timestamp = self._get_timestamp()
-            signature = self._sign(timestamp, HTTP_METHOD_STRINGS[http_method], url_path, body)
+            signature = self._sign(
+                timestamp,
+                HTTP_METHOD_STRINGS[http_method],
+                url_path,
+                body.decode(),
+            )
             headers = {
-                **self._headers,
-                "OK-ACCESS-KEY": self._api_key,
+                **self._signed_headers,
                 "OK-ACCESS-SIGN": signature,
                 "OK-ACCESS-TIMESTAMP": timestamp,
-                "OK-ACCESS-PASSPHRASE": self._passphrase,
             }
         else:
             headers = self._headers
 
-        if self.is_demo:
-            headers["x-simulated-trading"] = "1"
-
         # Uncomment for development
         # self._log.info(f"{url_path=}, {payload=}", LogColor.MAGENTA)
 
@@ -171,7 +179,7 @@ class OKXHttpClient:
             method=http_method,
             url=url,
             headers=headers,
-            body=body.encode(),
+            body=body,
             keys=ratelimiter_keys,
             timeout_secs=timeout_secs or self._default_timeout_secs,
         )
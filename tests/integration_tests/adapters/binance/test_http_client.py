@@ -0,0 +1,60 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.adapters.binance.common.enums import BinanceKeyType
+from nautilus_trader.adapters.binance.http.client import BinanceHttpClient
+from nautilus_trader.common.component import LiveClock
+from nautilus_trader.core.nautilus_pyo3 import HttpMethod
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("key_type", "expected_to_thread"),
+    [
+        [BinanceKeyType.HMAC, False],
+        [BinanceKeyType.RSA, True],
+        [BinanceKeyType.ED25519, False],
+    ],
+)
+async def test_sign_request_offloads_signing_to_thread_only_for_rsa(
+    mocker,
+    key_type: BinanceKeyType,
+    expected_to_thread: bool,
+) -> None:
+    # Arrange
+    client = BinanceHttpClient(
+        clock=LiveClock(),
+        api_key="SOME_BINANCE_API_KEY",
+        api_secret="SOME_BINANCE_API_SECRET",
+        base_url="https://api.binance.com/",
+        key_type=key_type,
+    )
+    mock_get_sign = mocker.patch.object(client, "_get_sign", return_value="SIGNATURE")
+    mock_to_thread = mocker.patch("asyncio.to_thread", return_value="SIGNATURE")
+    mock_send_request = mocker.patch.object(client, "send_request")
+
+    # Act
+    await client.sign_request(HttpMethod.GET, "/api/v3/account", payload={"timestamp": "1"})
+
+    # Assert
+    if expected_to_thread:
+        mock_to_thread.assert_awaited_once_with(mock_get_sign, "timestamp=1")
+        mock_get_sign.assert_not_called()
+    else:
+        mock_to_thread.assert_not_called()
+        mock_get_sign.assert_called_once_with("timestamp=1")
+    assert mock_send_request.call_args.kwargs["payload"]["signature"] == "SIGNATURE"
@@ -13,11 +13,16 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import asyncio
+
 import pytest
 
+from nautilus_trader.adapters.binance.common.enums import BinanceKlineInterval
 from nautilus_trader.adapters.binance.http.client import BinanceHttpClient
+from nautilus_trader.adapters.binance.http.error import BinanceServerError
 from nautilus_trader.adapters.binance.spot.http.market import BinanceSpotMarketHttpAPI
 from nautilus_trader.common.component import LiveClock
+from nautilus_trader.model.data import BarType
 
 
 @pytest.mark.skip(reason="WIP")
@@ -231,3 +236,176 @@ class TestBinanceSpotMarketHttpAPI:
         assert request["method"] == "GET"
         assert request["url"] == "https://api.binance.com/api/v3/avgPrice"
         assert request["params"] == "symbol=BTCUSDT"
+
+
+class TestBinanceMarketHttpAPIBars:
+    def setup(self):
+        # Fixture Setup
+        clock = LiveClock()
+        self.client = BinanceHttpClient(
+            clock=clock,
+            api_key="SOME_BINANCE_API_KEY",
+            api_secret="SOME_BINANCE_API_SECRET",
+            base_url="https://api.binance.com/",  # Spot/Margin
+        )
+
+        self.api = BinanceSpotMarketHttpAPI(self.client)
+
+    @pytest.mark.asyncio()
+    async def test_request_binance_bars_with_range_queries_page_windows(self, mocker):
+        # Arrange
+        first_page = [mocker.Mock(open_time=i * 60_000) for i in range(10)]
+        mock_query_klines = mocker.patch.object(
+            self.api,
+            "query_klines",
+            side_effect=[first_page, [], []],
+        )
+        bar_type = BarType.from_str("BTCUSDT.BINANCE-1-MINUTE-LAST-EXTERNAL")
+
+        # Act
+        bars = await self.api.request_binance_bars(
+            bar_type=bar_type,
+            ts_init=0,
+            interval=BinanceKlineInterval.MINUTE_1,
+            limit=10,
+            start_time=0,
+            end_time=1_500_000,
+        )
+
+        # Assert
+        assert len(bars) == 10
+        windows = [
+            (call.kwargs["start_time"], call.kwargs["end_time"])
+            for call in mock_query_klines.call_args_list
+        ]
+        assert windows == [(0, 1_500_000), (540_001, 1_140_000), (1_140_001, 1_500_000)]
+
+    @pytest.mark.asyncio()
+    async def test_request_binance_bars_with_limit_above_max_caps_page_size(self, mocker):
+        # Arrange
+        first_page = [mocker.Mock(open_time=i * 60_000) for i in range(1000)]
+        mock_query_klines = mocker.patch.object(
+            self.api,
+            "query_klines",
+            side_effect=[first_page, [], [], []],
+        )
+        bar_type = BarType.from_str("BTCUSDT.BINANCE-1-MINUTE-LAST-EXTERNAL")
+
+        # Act
+        await self.api.request_binance_bars(
+            bar_type=bar_type,
+            ts_init=0,
+            interval=BinanceKlineInterval.MINUTE_1,
+            limit=5000,
+            start_time=0,
+            end_time=200_000_000,
+        )
+
+        # Assert
+        calls = mock_query_klines.call_args_list
+        assert all(call.kwargs["limit"] == 1000 for call in calls)
+        assert [(call.kwargs["start_time"], call.kwargs["end_time"]) for call in calls] == [
+            (0, 200_000_000),
+            (59_940_001, 119_940_000),
+            (119_940_001, 179_940_000),
+            (179_940_001, 200_000_000),
+        ]
+
+    @pytest.mark.asyncio()
+    async def test_request_binance_bars_with_empty_first_page_makes_single_request(self, mocker):
+        # Arrange
+        mock_query_klines = mocker.patch.object(self.api, "query_klines", return_value=[])
+        bar_type = BarType.from_str("BTCUSDT.BINANCE-1-MINUTE-LAST-EXTERNAL")
+
+        # Act
+        bars = await self.api.request_binance_bars(
+            bar_type=bar_type,
+            ts_init=0,
+            interval=BinanceKlineInterval.MINUTE_1,
+            limit=10,
+            start_time=0,
+            end_time=1_500_000,
+        )
+
+        # Assert
+        assert bars == []
+        assert mock_query_klines.call_count == 1
+
+    @pytest.mark.asyncio()
+    async def test_request_binance_bars_with_gap_in_middle_window_returns_bars_in_order(
+        self,
+        mocker,
+    ):
+        # Arrange
+        def klines(minutes):
+            return [
+                mocker.Mock(
+                    open_time=m * 60_000,
+                    **{"parse_to_binance_bar.return_value": m},
+                )
+                for m in minutes
+            ]
+
+        pages = {
+            0: klines(range(10)),
+            540_001: klines([10, 11, 15]),  # Gap, fewer than a full page
+            1_140_001: klines(range(20, 30)),
+            1_740_001: klines(range(30, 36)),
+        }
+
+        async def query_klines(start_time, **kwargs):
+            # Finish the gap window last so completion order differs from window order
+            await asyncio.sleep(0.01 if start_time == 540_001 else 0)
+            return pages[start_time]
+
+        mocker.patch.object(self.api, "query_klines", side_effect=query_klines)
+        bar_type = BarType.from_str("BTCUSDT.BINANCE-1-MINUTE-LAST-EXTERNAL")
+
+        # Act
+        bars = await self.api.request_binance_bars(
+            bar_type=bar_type,
+            ts_init=0,
+            interval=BinanceKlineInterval.MINUTE_1,
+            limit=10,
+            start_time=0,
+            end_time=2_100_000,
+        )
+
+        # Assert
+        assert bars == [*range(12), 15, *range(20, 36)]
+
+    @pytest.mark.asyncio()
+    async def test_request_binance_bars_with_failed_window_cancels_batch_and_raises(
+        self,
+        mocker,
+    ):
+        # Arrange
+        first_page = [mocker.Mock(open_time=i * 60_000) for i in range(10)]
+        cancelled = []
+
+        async def query_klines(start_time, **kwargs):
+            if start_time == 0:
+                return first_page
+            if start_time == 540_001:
+                raise BinanceServerError(500, "Internal error", {})
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(start_time)
+                raise
+            return []
+
+        mocker.patch.object(self.api, "query_klines", side_effect=query_klines)
+        bar_type = BarType.from_str("BTCUSDT.BINANCE-1-MINUTE-LAST-EXTERNAL")
+
+        # Act, Assert
+        with pytest.raises(BinanceServerError):
+            await self.api.request_binance_bars(
+                bar_type=bar_type,
+                ts_init=0,
+                interval=BinanceKlineInterval.MINUTE_1,
+                limit=10,
+                start_time=0,
+                end_time=2_100_000,
+            )
+        assert sorted(cancelled) == [1_140_001, 1_740_001]
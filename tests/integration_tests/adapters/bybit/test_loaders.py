@@ -35,6 +35,7 @@ def test_load_bybit_deltas() -> None:
 
     # Assert
     assert len(deltas) == 3968
+    assert deltas[0].ts_event == 1733011200691000000
     assert deltas[0].action == BookAction.CLEAR
     assert deltas[1].action == BookAction.ADD
     assert deltas[1].order.side == OrderSide.SELL
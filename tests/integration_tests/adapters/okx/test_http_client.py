@@ -0,0 +1,97 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import base64
+import hashlib
+import hmac
+
+import msgspec
+import pytest
+
+from nautilus_trader.adapters.okx.http.client import OKXHttpClient
+from nautilus_trader.core.nautilus_pyo3 import HttpMethod
+
+
+@pytest.mark.parametrize(
+    ("method", "url_path", "body", "message"),
+    [
+        [
+            "GET",
+            "/api/v5/account/balance?ccy=BTC",
+            "",
+            "2020-12-08T09:08:57.715ZGET/api/v5/account/balance?ccy=BTC",
+        ],
+        [
+            "POST",
+            "/api/v5/trade/order",
+            '{"instId":"BTC-USDT","tdMode":"cash","side":"buy","ordType":"market","sz":"100"}',
+            '2020-12-08T09:08:57.715ZPOST/api/v5/trade/order{"instId":"BTC-USDT","tdMode":"cash","side":"buy","ordType":"market","sz":"100"}',
+        ],
+        [
+            "POST",
+            "/api/v5/trade/cancel-all-after",
+            "{}",
+            "2020-12-08T09:08:57.715ZPOST/api/v5/trade/cancel-all-after",
+        ],
+    ],
+)
+def test_sign_returns_base64_of_raw_hmac_digest(
+    okx_http_client: OKXHttpClient,
+    method: str,
+    url_path: str,
+    body: str,
+    message: str,
+) -> None:
+    # Arrange
+    expected = base64.b64encode(
+        hmac.new(b"SOME_OKX_API_SECRET", message.encode(), hashlib.sha256).digest(),
+    ).decode()
+
+    # Act
+    signature = okx_http_client._sign("2020-12-08T09:08:57.715Z", method, url_path, body)
+
+    # Assert
+    assert signature == expected
+    assert len(base64.b64decode(signature)) == 32
+
+
+@pytest.mark.asyncio()
+async def test_send_request_signs_the_exact_post_body_sent(
+    mocker,
+    okx_http_client: OKXHttpClient,
+) -> None:
+    # Arrange
+    mock_client = mocker.patch.object(okx_http_client, "_client")
+    mock_client.request = mocker.AsyncMock(
+        return_value=mocker.Mock(status=200, body=b'{"code":"0","msg":"","data":[]}'),
+    )
+    payload = {"instId": "BTC-USDT", "tdMode": "cash", "side": "buy", "ordType": "market"}
+
+    # Act
+    await okx_http_client.sign_request(HttpMethod.POST, "/api/v5/trade/order", payload=payload)
+
+    # Assert
+    request = mock_client.request.call_args.kwargs
+    body = request["body"]
+    headers = request["headers"]
+    message = headers["OK-ACCESS-TIMESTAMP"].encode() + b"POST/api/v5/trade/order" + body
+    expected = base64.b64encode(
+        hmac.new(b"SOME_OKX_API_SECRET", message, hashlib.sha256).digest(),
+    ).decode()
+    assert isinstance(body, bytes)
+    assert msgspec.json.decode(body) == payload
+    assert headers["OK-ACCESS-SIGN"] == expected
+    assert headers["OK-ACCESS-KEY"] == "SOME_OKX_API_KEY"
+    assert headers["OK-ACCESS-PASSPHRASE"] == "SOME_OKX_PASSPHRASE"